@@ -1,3 +1,23 @@
+from arblens.analytics.alerts import (
+    AlertEngine,
+    AlertRule,
+    AlertTransition,
+    depth_notional_columns,
+    pair_spread_columns,
+)
+from arblens.analytics.cycles import ArbitrageCycle, ArbitrageLeg, RateGraph
 from arblens.analytics.spread import PairSpread, calc_pair_spreads, extract_best_prices
 
-__all__ = ["extract_best_prices", "calc_pair_spreads", "PairSpread"]
+__all__ = [
+    "extract_best_prices",
+    "calc_pair_spreads",
+    "PairSpread",
+    "RateGraph",
+    "ArbitrageCycle",
+    "ArbitrageLeg",
+    "AlertEngine",
+    "AlertRule",
+    "AlertTransition",
+    "pair_spread_columns",
+    "depth_notional_columns",
+]
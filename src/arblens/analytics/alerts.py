@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from arblens.domain.models import OrderBook, OrderBookLevel
+from arblens.domain.models.exchange import PairSpread
+
+__all__ = [
+    "AlertEngine",
+    "AlertRule",
+    "AlertTransition",
+    "depth_notional_columns",
+    "pair_spread_columns",
+]
+
+Comparison = Literal[">", ">=", "<", "<="]
+
+
+def _hits_gt(column: Sequence[float], threshold: float) -> list[int]:
+    return [i for i, value in enumerate(column) if value > threshold]
+
+
+def _hits_ge(column: Sequence[float], threshold: float) -> list[int]:
+    return [i for i, value in enumerate(column) if value >= threshold]
+
+
+def _hits_lt(column: Sequence[float], threshold: float) -> list[int]:
+    return [i for i, value in enumerate(column) if value < threshold]
+
+
+def _hits_le(column: Sequence[float], threshold: float) -> list[int]:
+    return [i for i, value in enumerate(column) if value <= threshold]
+
+
+# One comprehension per operator keeps the comparison inline, where the interpreter
+# specialises float compares; this beats `compress(map(...))` over a bound method.
+# NaN compares False either way, so missing values never hit.
+_HITS: dict[str, Callable[[Sequence[float], float], list[int]]] = {
+    ">": _hits_gt,
+    ">=": _hits_ge,
+    "<": _hits_lt,
+    "<=": _hits_le,
+}
+_CLEAR: dict[str, Callable[[float, float], bool]] = {
+    ">": operator.le,
+    ">=": operator.lt,
+    "<": operator.ge,
+    "<=": operator.gt,
+}
+_MAX_STREAK = 0xFFFF
+
+
+@dataclass(frozen=True, slots=True)
+class AlertRule:
+    """Fire when `metric op threshold` holds for `consecutive` ticks in a row.
+
+    An active alert clears only once the value crosses back past `clear_threshold`
+    (defaults to `threshold`), which gives hysteresis around noisy levels.
+    """
+
+    name: str
+    metric: str
+    op: Comparison
+    threshold: float
+    consecutive: int = 1
+    clear_threshold: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.op not in _HITS:
+            raise ValueError(f"Unsupported comparison: {self.op}")
+        if not 1 <= self.consecutive <= _MAX_STREAK:
+            raise ValueError("consecutive must be between 1 and 65535")
+        if self.clear_threshold is not None:
+            offset = self.clear_threshold - self.threshold
+            if (offset > 0) if self.op in (">", ">=") else (offset < 0):
+                raise ValueError("clear_threshold must lie on the non-firing side of threshold")
+
+
+@dataclass(frozen=True, slots=True)
+class AlertTransition:
+    rule: str
+    key: str
+    active: bool
+    value: float
+
+
+class _CompiledRule:
+    __slots__ = ("rule", "hits", "clear", "clear_threshold", "streaks", "active", "active_indices")
+
+    def __init__(self, rule: AlertRule, size: int) -> None:
+        self.rule = rule
+        self.hits = _HITS[rule.op]
+        self.clear = _CLEAR[rule.op]
+        self.clear_threshold = (
+            rule.threshold if rule.clear_threshold is None else rule.clear_threshold
+        )
+        self.streaks = array("H", bytes(2 * size))
+        self.active = array("b", bytes(size))
+        # Mirrors `active` so clearing visits active keys only, not the whole universe.
+        self.active_indices: set[int] = set()
+
+
+def pair_spread_columns(
+    spreads: Sequence[PairSpread],
+    reference_prices: Sequence[float | None] | None = None,
+) -> dict[str, list[float]]:
+    """Metric columns for `AlertEngine` from one `PairSpread` per key.
+
+    Missing spreads become NaN, which neither fires nor clears a rule. With
+    `reference_prices`, relative `spread_sell_pct`/`spread_buy_pct` (fractions) are added.
+    """
+    nan = math.nan
+    sell = [nan if s.spread_sell is None else s.spread_sell for s in spreads]
+    buy = [nan if s.spread_buy is None else s.spread_buy for s in spreads]
+    columns = {"spread_sell": sell, "spread_buy": buy}
+    if reference_prices is not None:
+        if len(reference_prices) != len(spreads):
+            raise ValueError("reference_prices must align with spreads")
+        prices = [nan if not price else price for price in reference_prices]
+        columns["spread_sell_pct"] = list(map(operator.truediv, sell, prices))
+        columns["spread_buy_pct"] = list(map(operator.truediv, buy, prices))
+    return columns
+
+
+def _notional_within(levels: Sequence[OrderBookLevel], limit: float, bids: bool) -> float:
+    total = 0.0
+    for level in levels:
+        if (level.price < limit) if bids else (level.price > limit):
+            break
+        total += level.price * level.size
+    return total
+
+
+def depth_notional_columns(
+    books: Sequence[OrderBook | None],
+    within_bps: float = 10.0,
+) -> dict[str, list[float]]:
+    """`bid_notional`/`ask_notional` columns: quote notional within `within_bps` of best.
+
+    Levels are expected best-first, as the exchange parsers return them. A missing book
+    or an empty side becomes NaN.
+    """
+    band = within_bps / 10_000
+    bid_notional: list[float] = []
+    ask_notional: list[float] = []
+    for book in books:
+        if book is not None and book.bids:
+            limit = book.bids[0].price * (1 - band)
+            bid_notional.append(_notional_within(book.bids, limit, bids=True))
+        else:
+            bid_notional.append(math.nan)
+        if book is not None and book.asks:
+            limit = book.asks[0].price * (1 + band)
+            ask_notional.append(_notional_within(book.asks, limit, bids=False))
+        else:
+            ask_notional.append(math.nan)
+    return {"bid_notional": bid_notional, "ask_notional": ask_notional}
+
+
+class AlertEngine:
+    """Evaluate alert rules over metric columns for a fixed universe of keys.
+
+    Each tick takes one column per metric, aligned with `keys`. Every rule scans the
+    whole column once for hits, then only touches keys that hit or are already active.
+    Debounce counters and active flags live in compact arrays, and only activations and
+    clears are returned.
+    """
+
+    def __init__(self, rules: Sequence[AlertRule], keys: Sequence[str]) -> None:
+        names = [rule.name for rule in rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Alert rule names must be unique")
+        self.keys = tuple(keys)
+        self._rules = [_CompiledRule(rule, len(self.keys)) for rule in rules]
+
+    def active(self, rule_name: str) -> list[str]:
+        for compiled in self._rules:
+            if compiled.rule.name == rule_name:
+                return [key for key, flag in zip(self.keys, compiled.active, strict=True) if flag]
+        raise KeyError(rule_name)
+
+    def evaluate(self, metrics: Mapping[str, Sequence[float]]) -> list[AlertTransition]:
+        """Advance one tick; transitions come per rule, activations first, in key order."""
+        size = len(self.keys)
+        transitions: list[AlertTransition] = []
+        for compiled in self._rules:
+            rule = compiled.rule
+            try:
+                column = metrics[rule.metric]
+            except KeyError as exc:
+                raise ValueError(f"Missing metric column: {rule.metric}") from exc
+            if len(column) != size:
+                raise ValueError(f"Metric column {rule.metric} has {len(column)} values")
+
+            # One tight pass over the column; the rest of the tick touches hit keys only.
+            hit_indices = compiled.hits(column, rule.threshold)
+            previous = compiled.streaks
+            # Every key that missed this tick resets to zero in one bulk allocation.
+            streaks = array("H", bytes(2 * size))
+            for i in hit_indices:
+                streak = previous[i] + 1 if previous[i] < _MAX_STREAK else _MAX_STREAK
+                streaks[i] = streak
+                if streak >= rule.consecutive and not compiled.active[i]:
+                    compiled.active[i] = 1
+                    compiled.active_indices.add(i)
+                    transitions.append(AlertTransition(rule.name, self.keys[i], True, column[i]))
+            compiled.streaks = streaks
+
+            # Only active keys that missed can clear; usually a small set.
+            clear, clear_threshold = compiled.clear, compiled.clear_threshold
+            for i in sorted(compiled.active_indices):
+                if not streaks[i] and clear(column[i], clear_threshold):
+                    compiled.active[i] = 0
+                    compiled.active_indices.discard(i)
+                    transitions.append(AlertTransition(rule.name, self.keys[i], False, column[i]))
+        return transitions
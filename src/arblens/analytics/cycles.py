@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from arblens.domain.models import OrderBook
+
+__all__ = ["ArbitrageCycle", "ArbitrageLeg", "RateGraph"]
+
+# Relaxations smaller than this are float noise, not arbitrage.
+_EPSILON = 1e-12
+
+
+@dataclass(frozen=True, slots=True)
+class ArbitrageLeg:
+    from_asset: str
+    to_asset: str
+    venue: str
+    rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class ArbitrageCycle:
+    legs: tuple[ArbitrageLeg, ...]
+
+    @property
+    def gross_return(self) -> float:
+        """Fractional gain from converting one unit around the cycle once."""
+        return math.prod(leg.rate for leg in self.legs) - 1.0
+
+
+class RateGraph:
+    """Conversion rates between assets, built from top of book on every venue.
+
+    A BASE/QUOTE book adds BASE -> QUOTE at the best bid (sell base) and
+    QUOTE -> BASE at 1 / best ask (buy base). Each directed edge keeps the best rate
+    across venues, assuming inventory is already held on each venue. Taker fees per
+    venue, when given, are applied multiplicatively to every rate.
+    """
+
+    def __init__(self, taker_fees: Mapping[str, float] | None = None) -> None:
+        self._fees = dict(taker_fees or {})
+        self._quotes: dict[tuple[str, str], dict[str, float]] = {}
+        self._best: dict[tuple[str, str], tuple[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._best)
+
+    def update(self, book: OrderBook) -> None:
+        """Refresh the two edges of `book`'s instrument for its venue only."""
+        base, quote = book.symbol.split("/")
+        fee = self._fees.get(book.venue, 0.0)
+        bid = book.bids[0].price * (1 - fee) if book.bids else None
+        ask_rate = (1 - fee) / book.asks[0].price if book.asks else None
+        self._set_rate((base, quote), book.venue, bid)
+        self._set_rate((quote, base), book.venue, ask_rate)
+
+    def _set_rate(self, edge: tuple[str, str], venue: str, rate: float | None) -> None:
+        quotes = self._quotes.setdefault(edge, {})
+        if rate is None or rate <= 0:
+            quotes.pop(venue, None)
+        else:
+            quotes[venue] = rate
+
+        best = self._best.get(edge)
+        if rate is not None and rate > 0 and (best is None or rate >= best[1]):
+            self._best[edge] = (venue, rate)
+        elif best is not None and best[0] == venue:
+            # The venue that held the best rate got worse; rescan the few venues left.
+            if quotes:
+                best_venue = max(quotes, key=quotes.__getitem__)
+                self._best[edge] = (best_venue, quotes[best_venue])
+            else:
+                del self._best[edge]
+
+    def find_cycles(self, min_return: float = 0.0) -> list[ArbitrageCycle]:
+        """Profitable cycles found with Bellman-Ford over -log(rate) edge weights."""
+        assets = sorted({asset for edge in self._best for asset in edge})
+        index = {asset: i for i, asset in enumerate(assets)}
+        edges = [
+            (index[src], index[dst], -math.log(rate), (src, dst))
+            for (src, dst), (_, rate) in self._best.items()
+        ]
+
+        # Starting every distance at zero acts as a virtual source linked to all nodes.
+        dist = [0.0] * len(assets)
+        pred: list[tuple[str, str] | None] = [None] * len(assets)
+        for _ in range(len(assets)):
+            relaxed = False
+            for u, v, weight, edge in edges:
+                if dist[u] + weight < dist[v] - _EPSILON:
+                    dist[v] = dist[u] + weight
+                    pred[v] = edge
+                    relaxed = True
+            if not relaxed:
+                return []
+
+        cycles: dict[frozenset[tuple[str, str]], ArbitrageCycle] = {}
+        for u, v, weight, _ in edges:
+            if dist[u] + weight >= dist[v] - _EPSILON:
+                continue
+            cycle = self._walk_cycle(assets[v], pred, index)
+            if cycle is None:
+                continue
+            key = frozenset((leg.from_asset, leg.to_asset) for leg in cycle.legs)
+            if key not in cycles and cycle.gross_return > min_return:
+                cycles[key] = cycle
+        return sorted(cycles.values(), key=lambda cycle: cycle.gross_return, reverse=True)
+
+    def _walk_cycle(
+        self,
+        start: str,
+        pred: list[tuple[str, str] | None],
+        index: Mapping[str, int],
+    ) -> ArbitrageCycle | None:
+        # Step back once per node to be sure we are inside the cycle, not on a tail.
+        node = start
+        for _ in range(len(index)):
+            edge = pred[index[node]]
+            if edge is None:
+                return None
+            node = edge[0]
+
+        legs: list[ArbitrageLeg] = []
+        current = node
+        for _ in range(len(index)):
+            edge = pred[index[current]]
+            if edge is None:
+                return None
+            venue, rate = self._best[edge]
+            legs.append(ArbitrageLeg(edge[0], edge[1], venue, rate))
+            current = edge[0]
+            if current == node:
+                break
+        else:
+            return None
+        legs.reverse()
+        return ArbitrageCycle(tuple(legs))
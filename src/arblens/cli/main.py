@@ -1,13 +1,24 @@
 import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Annotated
 
 import typer
 
 from arblens.analytics import calc_pair_spreads, extract_best_prices
 from arblens.domain.models import OrderBook
 from arblens.domain.models.exchange import Exchange
+from arblens.exchanges.base import ExchangeClient
 from arblens.exchanges.bybit import BybitClient
+from arblens.exchanges.clock import ClockCorrectedClient
+from arblens.exchanges.depth import AdaptiveDepthClient, DepthPolicy
+from arblens.exchanges.hedging import HedgingClient
 from arblens.exchanges.okx import OkxClient
 from arblens.exchanges.pair import ExchangePair
+from arblens.pipeline.fanout import BookPublisher
+from arblens.pipeline.freshness import is_stale
+from arblens.pipeline.profiling import StageProfiler, profile_stage, profiling
 
 app = typer.Typer(help="Arblens CLI")
 
@@ -19,8 +30,139 @@ def callback() -> None:
 
 
 @app.command()
-def report(symbol: str = "BTC/USDT", depth: int = 20) -> None:
-    pair = ExchangePair(BybitClient(), OkxClient())
+def report(
+    symbol: str = "BTC/USDT",
+    depth: int = 20,
+    hedge: bool = False,
+    max_age_ms: float | None = None,
+    profile: Path | None = None,
+) -> None:
+    _run_profiled(profile, lambda: _report(symbol, depth, hedge, max_age_ms))
+
+
+@app.command()
+def publish(
+    socket: Path = Path("/tmp/arblens.sock"),
+    symbol: Annotated[list[str] | None, typer.Option()] = None,
+    depth: int = 20,
+    interval: float = 1.0,
+    cycles: int = 0,
+    hedge: bool = False,
+    notional: float | None = None,
+    max_age_ms: float | None = None,
+    profile: Path | None = None,
+) -> None:
+    """Poll order books and fan them out to local subscribers on a Unix socket."""
+    symbols = symbol or ["BTC/USDT"]
+    _run_profiled(
+        profile,
+        lambda: asyncio.run(
+            _publish(socket, symbols, depth, interval, cycles, hedge, notional, max_age_ms)
+        ),
+    )
+
+
+def _run_profiled(profile: Path | None, run: Callable[[], None]) -> None:
+    if profile is None:
+        run()
+        return
+
+    with profiling(StageProfiler()) as profiler:
+        try:
+            run()
+        except KeyboardInterrupt:
+            pass
+    summary_path = profiler.dump(profile)
+    typer.echo(profiler.summary())
+    typer.echo(f"profile written to {profile} (summary: {summary_path})")
+
+
+def _build_pair(hedge: bool, notional: float | None, clock: bool) -> ExchangePair:
+    left: ExchangeClient = BybitClient()
+    right: ExchangeClient = OkxClient()
+    if hedge:
+        left, right = HedgingClient(left), HedgingClient(right)
+    if notional is not None:
+        policy = DepthPolicy(target_notional=notional)
+        left, right = AdaptiveDepthClient(left, policy), AdaptiveDepthClient(right, policy)
+    if clock:
+        left, right = ClockCorrectedClient(left), ClockCorrectedClient(right)
+    return ExchangePair(left, right)
+
+
+def _max_age(max_age_ms: float | None) -> timedelta | None:
+    return timedelta(milliseconds=max_age_ms) if max_age_ms is not None else None
+
+
+async def _publish(
+    socket: Path,
+    symbols: list[str],
+    depth: int,
+    interval: float,
+    cycles: int,
+    hedge: bool,
+    notional: float | None,
+    max_age_ms: float | None,
+) -> None:
+    max_age = _max_age(max_age_ms)
+    pair = _build_pair(hedge, notional, clock=max_age is not None)
+    clients = (pair.left, pair.right)
+    async with BookPublisher(socket) as publisher:
+        typer.echo(f"Publishing {', '.join(symbols)} on {socket}")
+        try:
+            await _publish_cycles(publisher, clients, symbols, depth, interval, cycles, max_age)
+        finally:
+            # Also runs on Ctrl-C, which is how the default endless loop ends.
+            stats = publisher.stats()
+            typer.echo(
+                f"published={stats.published} subscribers={stats.subscribers} "
+                f"conflated={stats.conflated} dropped={stats.dropped}"
+            )
+            _echo_client_stats(pair)
+
+
+async def _publish_cycles(
+    publisher: BookPublisher,
+    clients: tuple[ExchangeClient, ExchangeClient],
+    symbols: list[str],
+    depth: int,
+    interval: float,
+    cycles: int,
+    max_age: timedelta | None,
+) -> None:
+    cycle = 0
+    while cycles <= 0 or cycle < cycles:
+        cycle += 1
+        with profile_stage("fetch"):
+            results = await asyncio.gather(
+                *(client.fetch_order_book(sym, depth) for client in clients for sym in symbols),
+                return_exceptions=True,
+            )
+        with profile_stage("publish"):
+            for result in results:
+                if isinstance(result, BaseException):
+                    typer.echo(f"fetch error: {result}")
+                    continue
+                if max_age is not None and is_stale(result, max_age):
+                    typer.echo(f"{result.venue} {result.symbol}: stale: age={result.age}")
+                    continue
+                try:
+                    publisher.publish(result)
+                except ValueError as exc:
+                    typer.echo(f"{result.venue} {result.symbol}: publish error: {exc}")
+        if cycles <= 0 or cycle < cycles:
+            await asyncio.sleep(interval)
+
+
+def _report(
+    symbol: str,
+    depth: int,
+    hedge: bool,
+    max_age_ms: float | None,
+) -> None:
+    max_age = _max_age(max_age_ms)
+    # Adaptive depth needs book shape from earlier cycles, so it is a publish-only option.
+    pair = _build_pair(hedge, notional=None, clock=max_age is not None)
 
     async def _fetch_books() -> dict[Exchange, OrderBook | BaseException]:
         requests = {
@@ -30,7 +172,8 @@ def report(symbol: str = "BTC/USDT", depth: int = 20) -> None:
         results = await asyncio.gather(*requests.values(), return_exceptions=True)
         return dict(zip(requests.keys(), results, strict=True))
 
-    books = asyncio.run(_fetch_books())
+    with profile_stage("fetch"):
+        books = asyncio.run(_fetch_books())
 
     typer.echo(f"Report for {symbol} (depth={depth})")
 
@@ -40,15 +183,23 @@ def report(symbol: str = "BTC/USDT", depth: int = 20) -> None:
             typer.echo(f"{venue}: error: {result}")
             best_prices[venue] = (None, None)
             continue
+        if max_age is not None and is_stale(result, max_age):
+            # Skip analytics on books too old to act on.
+            typer.echo(f"{venue}: stale: age={result.age}")
+            best_prices[venue] = (None, None)
+            continue
 
-        best_bid, best_ask = extract_best_prices(result)
+        with profile_stage("analytics"):
+            best_bid, best_ask = extract_best_prices(result)
         best_prices[venue] = (best_bid, best_ask)
-        typer.echo(f"{venue}: best_bid={best_bid} best_ask={best_ask}")
+        age = f" age={result.age}" if result.age is not None else ""
+        typer.echo(f"{venue}: best_bid={best_bid} best_ask={best_ask}{age}")
 
-    spreads = calc_pair_spreads(
-        best_prices[pair.left.venue],
-        best_prices[pair.right.venue],
-    )
+    with profile_stage("analytics"):
+        spreads = calc_pair_spreads(
+            best_prices[pair.left.venue],
+            best_prices[pair.right.venue],
+        )
 
     # Sell on first (hit bid) and buy on second (lift ask)
     if spreads.spread_sell is not None:
@@ -58,6 +209,34 @@ def report(symbol: str = "BTC/USDT", depth: int = 20) -> None:
     if spreads.spread_buy is not None:
         typer.echo(f"spreadBuy (rightSell - leftBuy): {spreads.spread_buy}")
 
+    _echo_client_stats(pair)
+
+
+def _echo_client_stats(pair: ExchangePair) -> None:
+    """Print client wrapper stats; adaptive ones only settle over many cycles."""
+    for client in (pair.left, pair.right):
+        if isinstance(client, ClockCorrectedClient):
+            typer.echo(
+                f"{client.venue}: clock_offset={client.estimator.offset} "
+                f"latency={client.estimator.latency}"
+            )
+            client = client.inner
+        if isinstance(client, AdaptiveDepthClient):
+            depth_stats = client.stats()
+            typer.echo(
+                f"{client.venue}: fetches={depth_stats.fetches} "
+                f"refetches={depth_stats.refetches} "
+                f"levels_requested={depth_stats.levels_requested}"
+            )
+            client = client.inner
+        if isinstance(client, HedgingClient):
+            stats = client.stats()
+            typer.echo(
+                f"{client.venue}: hedge_rate={stats.hedge_rate:.2f} "
+                f"hedges={stats.hedges}/{stats.requests} hedge_wins={stats.hedge_wins} "
+                f"p99={stats.p99_latency} p99_improvement={stats.p99_improvement}"
+            )
+
 
 if __name__ == "__main__":
     app()
@@ -1,6 +1,6 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,3 +16,5 @@ class OrderBook:
     timestamp: datetime
     venue: str
     symbol: str
+    # Venue-clock-corrected age on receipt; None when no clock estimate is available.
+    age: timedelta | None = None
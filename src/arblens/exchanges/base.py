@@ -1,12 +1,27 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
 
 from arblens.domain.models import OrderBook
 from arblens.domain.models.exchange import Exchange
 
 
+@dataclass(frozen=True, slots=True)
+class ServerTimeProbe:
+    """Venue clock reading, bracketed by local send/receive times (seconds since epoch)."""
+
+    server_time: datetime
+    sent: float
+    received: float
+
+
 class ExchangeClient(ABC):
     venue: Exchange
 
     @abstractmethod
     async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
         raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        raise NotImplementedError
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
@@ -9,7 +10,7 @@ import httpx
 
 from arblens.domain.models import OrderBook, OrderBookLevel
 from arblens.domain.models.exchange import Exchange
-from arblens.exchanges.base import ExchangeClient
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
 from arblens.exchanges.errors import (
     ExchangeError,
     ExchangeHttpError,
@@ -17,6 +18,7 @@ from arblens.exchanges.errors import (
     ExchangeRateLimitError,
 )
 from arblens.exchanges.symbols import canonical_symbol, exchange_symbol
+from arblens.pipeline.profiling import profile_stage
 
 _BYBIT_TIMEOUT = httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=10.0)
 _BYBIT_BASE_URL = "https://api.bybit.com"
@@ -61,10 +63,15 @@ def parse_bybit_order_book(payload: dict[str, Any], symbol: str) -> OrderBook:
     if not isinstance(raw_bids, list) or not isinstance(raw_asks, list):
         raise ExchangeParseError("Bybit payload missing bids/asks arrays")
 
-    bids = sorted(_parse_levels(raw_bids), key=lambda level: level.price, reverse=True)
-    asks = sorted(_parse_levels(raw_asks), key=lambda level: level.price)
+    with profile_stage("parse_levels"):
+        parsed_bids = _parse_levels(raw_bids)
+        parsed_asks = _parse_levels(raw_asks)
+    with profile_stage("sort"):
+        bids = sorted(parsed_bids, key=lambda level: level.price, reverse=True)
+        asks = sorted(parsed_asks, key=lambda level: level.price)
 
-    timestamp_value = result.get("ts")
+    # Fall back to the response's server time before trusting the local clock.
+    timestamp_value = result.get("ts", payload.get("time"))
     if timestamp_value is None:
         timestamp = datetime.now(UTC)
     else:
@@ -83,6 +90,25 @@ def parse_bybit_order_book(payload: dict[str, Any], symbol: str) -> OrderBook:
     )
 
 
+def parse_bybit_server_time(payload: dict[str, Any]) -> datetime:
+    ret_code = payload.get("retCode")
+    if ret_code not in (0, "0", None):
+        ret_msg = payload.get("retMsg", "")
+        raise ExchangeError(f"Bybit API error {ret_code}: {ret_msg}")
+
+    result = payload.get("result")
+    if not isinstance(result, dict):
+        raise ExchangeParseError("Bybit payload missing result")
+
+    try:
+        time_nano = result.get("timeNano")
+        if time_nano is not None:
+            return datetime.fromtimestamp(int(time_nano) / 1_000_000_000, tz=UTC)
+        return datetime.fromtimestamp(int(result["timeSecond"]), tz=UTC)
+    except (KeyError, ValueError, TypeError) as exc:
+        raise ExchangeParseError("Bybit payload has invalid server time") from exc
+
+
 class BybitClient(ExchangeClient):
     venue = Exchange.BYBIT
 
@@ -90,24 +116,44 @@ class BybitClient(ExchangeClient):
         exchange_sym = exchange_symbol(self.venue, symbol)
         params = {"category": "spot", "symbol": exchange_sym, "limit": str(depth)}
 
-        async with httpx.AsyncClient(base_url=_BYBIT_BASE_URL, timeout=_BYBIT_TIMEOUT) as client:
-            try:
-                response = await client.get("/v5/market/orderbook", params=params)
-            except httpx.TimeoutException as exc:
-                raise ExchangeError("Bybit request timed out") from exc
-            except httpx.HTTPError as exc:
-                raise ExchangeError("Bybit request failed") from exc
+        async with self._http_client() as client:
+            payload = await self._get_json(client, "/v5/market/orderbook", params)
+        return parse_bybit_order_book(payload, symbol)
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        async with self._http_client() as client:
+            # The first request pays for DNS, TCP and TLS setup; only the second, over the
+            # warm pooled connection, is timed.
+            await self._get_json(client, "/v5/market/time", {})
+            sent = time.time()
+            payload = await self._get_json(client, "/v5/market/time", {})
+            received = time.time()
+        return ServerTimeProbe(parse_bybit_server_time(payload), sent=sent, received=received)
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=_BYBIT_BASE_URL, timeout=_BYBIT_TIMEOUT)
+
+    async def _get_json(
+        self, client: httpx.AsyncClient, path: str, params: dict[str, str]
+    ) -> dict[str, Any]:
+        try:
+            response = await client.get(path, params=params)
+        except httpx.TimeoutException as exc:
+            raise ExchangeError("Bybit request timed out") from exc
+        except httpx.HTTPError as exc:
+            raise ExchangeError("Bybit request failed") from exc
 
         if response.status_code != 200:
             body_snippet = response.text[:200]
             raise ExchangeHttpError(response.status_code, body_snippet)
 
         try:
-            payload = response.json()
+            with profile_stage("json_decode"):
+                payload = response.json()
         except ValueError as exc:
             raise ExchangeParseError("Bybit response is not valid JSON") from exc
 
         if not isinstance(payload, dict):
             raise ExchangeParseError("Bybit JSON response is not an object")
 
-        return parse_bybit_order_book(payload, symbol)
+        return payload
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import timedelta
+
+from arblens.domain.models import OrderBook
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
+from arblens.exchanges.errors import ExchangeError
+
+
+@dataclass(frozen=True, slots=True)
+class ClockSample:
+    offset: float
+    round_trip: float
+
+
+class ClockSkewEstimator:
+    """Estimate a venue's clock offset (server minus local, seconds) and one-way latency.
+
+    Each server-time probe gives offset = server - midpoint(sent, received). Probes
+    with long round trips carry the most error, so the estimate comes from the sample
+    with the shortest round trip among the last `window` probes.
+    """
+
+    def __init__(self, window: int = 8) -> None:
+        if window < 1:
+            raise ValueError("window must be a positive integer")
+        self._samples: deque[ClockSample] = deque(maxlen=window)
+
+    def observe(self, sent: float, received: float, server_time: float) -> ClockSample:
+        """Record a probe; all arguments are seconds since the epoch."""
+        sample = ClockSample(offset=server_time - (sent + received) / 2, round_trip=received - sent)
+        self._samples.append(sample)
+        return sample
+
+    def _best(self) -> ClockSample | None:
+        return min(self._samples, key=lambda sample: sample.round_trip, default=None)
+
+    @property
+    def offset(self) -> float | None:
+        best = self._best()
+        return best.offset if best is not None else None
+
+    @property
+    def latency(self) -> float | None:
+        best = self._best()
+        return best.round_trip / 2 if best is not None else None
+
+    def age(self, book: OrderBook, received: float) -> timedelta | None:
+        """Age of `book` on the venue clock at local time `received`."""
+        offset = self.offset
+        if offset is None:
+            return None
+        return timedelta(seconds=received + offset - book.timestamp.timestamp())
+
+
+class ClockCorrectedClient(ExchangeClient):
+    """Wrap a client and annotate fetched books with their clock-corrected age.
+
+    The venue clock is probed through `fetch_server_time` at most every
+    `resync_interval` seconds, concurrently with the book request. A failed probe
+    keeps the previous estimate instead of failing the fetch.
+    """
+
+    def __init__(
+        self,
+        inner: ExchangeClient,
+        estimator: ClockSkewEstimator | None = None,
+        resync_interval: float = 60.0,
+    ) -> None:
+        self.inner = inner
+        self.venue = inner.venue
+        self.estimator = estimator or ClockSkewEstimator()
+        self.resync_interval = resync_interval
+        self._last_sync: float | None = None
+
+    async def sync(self) -> ClockSample | None:
+        self._last_sync = time.monotonic()
+        try:
+            probe = await self.inner.fetch_server_time()
+        except ExchangeError:
+            return None
+        return self.estimator.observe(probe.sent, probe.received, probe.server_time.timestamp())
+
+    def _sync_due(self) -> bool:
+        return self._last_sync is None or (
+            time.monotonic() - self._last_sync >= self.resync_interval
+        )
+
+    async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
+        if self._sync_due():
+            (received, book), _ = await asyncio.gather(self._fetch(symbol, depth), self.sync())
+        else:
+            received, book = await self._fetch(symbol, depth)
+        return replace(book, age=self.estimator.age(book, received))
+
+    async def _fetch(self, symbol: str, depth: int) -> tuple[float, OrderBook]:
+        book = await self.inner.fetch_order_book(symbol, depth)
+        return time.time(), book
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        return await self.inner.fetch_server_time()
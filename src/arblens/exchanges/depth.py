@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from arblens.domain.models import OrderBook, OrderBookLevel
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
+from arblens.exchanges.symbols import canonical_symbol
+
+# Depths accepted by both Bybit (`limit`) and OKX (`sz`) spot order book endpoints.
+_DEPTH_TIERS = (1, 5, 10, 20, 50, 100, 200)
+
+
+@dataclass(frozen=True, slots=True)
+class DepthPolicy:
+    """How to size order book requests for a target notional (quote currency).
+
+    `headroom` inflates the estimated level count so small book changes between
+    cycles still fit; `smoothing` is the EWMA weight of the newest book shape.
+    """
+
+    target_notional: float
+    max_depth: int = 200
+    headroom: float = 1.5
+    smoothing: float = 0.3
+
+    def __post_init__(self) -> None:
+        if self.target_notional <= 0:
+            raise ValueError("target_notional must be positive")
+        if not 1 <= self.max_depth <= _DEPTH_TIERS[-1]:
+            # Deeper requests are not accepted by the venues, and the refetch loop
+            # relies on reaching max_depth to stop.
+            raise ValueError(f"max_depth must be between 1 and {_DEPTH_TIERS[-1]}")
+        if self.headroom < 1.0:
+            raise ValueError("headroom must be >= 1")
+        if not 0.0 < self.smoothing <= 1.0:
+            raise ValueError("smoothing must be in (0, 1]")
+
+
+@dataclass(frozen=True, slots=True)
+class DepthStats:
+    fetches: int
+    refetches: int
+    levels_requested: int
+
+
+def side_notional(levels: Sequence[OrderBookLevel]) -> float:
+    return sum(level.price * level.size for level in levels)
+
+
+def depth_tier(levels: int, max_depth: int) -> int:
+    """Smallest supported depth covering `levels`, capped at `max_depth`."""
+    for tier in _DEPTH_TIERS:
+        if tier >= levels:
+            return min(tier, max_depth)
+    return min(_DEPTH_TIERS[-1], max_depth)
+
+
+class AdaptiveDepthClient(ExchangeClient):
+    """Wrap a client and request only as many levels as the target notional needs.
+
+    Book shape is tracked per symbol as the smoothed notional per level of the
+    thinner side. The `depth` passed to `fetch_order_book` is only the first guess
+    for a symbol that has not been seen yet. A deeper request is made only when the
+    returned book is full yet one side still falls short of the target notional.
+    """
+
+    def __init__(self, inner: ExchangeClient, policy: DepthPolicy) -> None:
+        self.inner = inner
+        self.venue = inner.venue
+        self.policy = policy
+        self._notional_per_level: dict[str, float] = {}
+        self._fetches = 0
+        self._refetches = 0
+        self._levels_requested = 0
+
+    def planned_depth(self, symbol: str, fallback: int) -> int:
+        per_level = self._notional_per_level.get(canonical_symbol(symbol))
+        if per_level is None or per_level <= 0:
+            return depth_tier(fallback, self.policy.max_depth)
+        levels = math.ceil(self.policy.target_notional * self.policy.headroom / per_level)
+        return depth_tier(levels, self.policy.max_depth)
+
+    def stats(self) -> DepthStats:
+        return DepthStats(
+            fetches=self._fetches,
+            refetches=self._refetches,
+            levels_requested=self._levels_requested,
+        )
+
+    def _observe(self, book: OrderBook) -> None:
+        shapes = [
+            side_notional(levels) / len(levels) for levels in (book.bids, book.asks) if levels
+        ]
+        if not shapes:
+            return
+        latest = min(shapes)
+        previous = self._notional_per_level.get(book.symbol)
+        if previous is None:
+            self._notional_per_level[book.symbol] = latest
+        else:
+            alpha = self.policy.smoothing
+            self._notional_per_level[book.symbol] = alpha * latest + (1 - alpha) * previous
+
+    def _is_short(self, book: OrderBook, depth: int) -> bool:
+        # A side with fewer levels than requested is the whole book; going deeper won't help.
+        return any(
+            len(levels) >= depth and side_notional(levels) < self.policy.target_notional
+            for levels in (book.bids, book.asks)
+        )
+
+    async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
+        depth = self.planned_depth(symbol, depth)
+        while True:
+            self._fetches += 1
+            self._levels_requested += depth
+            book = await self.inner.fetch_order_book(symbol, depth)
+            self._observe(book)
+            if depth >= self.policy.max_depth or not self._is_short(book, depth):
+                return book
+            deeper = max(
+                self.planned_depth(symbol, depth), depth_tier(depth + 1, self.policy.max_depth)
+            )
+            self._refetches += 1
+            depth = deeper
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        return await self.inner.fetch_server_time()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from arblens.domain.models import OrderBook
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
+
+
+@dataclass(frozen=True, slots=True)
+class HedgePolicy:
+    """When to fire a duplicate order book request and how many are allowed.
+
+    The hedge delay is the `percentile` of recent primary latencies, clamped to
+    `min_delay`. Until `min_samples` latencies are known, `initial_delay` is used.
+    The budget is a token bucket: each request earns `budget_ratio` of a hedge, each
+    hedge spends one, and the balance is capped at `budget_burst` (at least one), so a
+    quiet stretch cannot bank hedges for the next slow spell.
+    """
+
+    percentile: float = 0.95
+    min_samples: int = 20
+    initial_delay: float = 0.5
+    min_delay: float = 0.05
+    window: int = 256
+    budget_ratio: float = 0.1
+    budget_burst: int = 2
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile <= 1.0:
+            raise ValueError("percentile must be in (0, 1]")
+        if self.min_samples < 1 or self.window < self.min_samples:
+            raise ValueError("window must be >= min_samples >= 1")
+        if self.initial_delay < 0 or self.min_delay < 0:
+            raise ValueError("delays must be non-negative")
+        if self.budget_ratio < 0 or self.budget_burst < 0:
+            raise ValueError("budget must be non-negative")
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeStats:
+    requests: int
+    hedges: int
+    hedge_wins: int
+    p99_latency: float | None
+    p99_unhedged_latency: float | None
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedges / self.requests if self.requests else 0.0
+
+    @property
+    def p99_improvement(self) -> float | None:
+        """Seconds shaved off p99 compared to waiting for the primary request only."""
+        if self.p99_latency is None or self.p99_unhedged_latency is None:
+            return None
+        return self.p99_unhedged_latency - self.p99_latency
+
+
+def _percentile(samples: Iterable[float], q: float) -> float | None:
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    # Nearest-rank percentile keeps the result an actually observed latency.
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+class HedgingClient(ExchangeClient):
+    """Wrap a client and hedge slow `fetch_order_book` calls with a duplicate request.
+
+    The first successful response wins. The losing request is not cancelled: it has
+    already been sent and counted against the venue rate limit, so it is left to
+    finish and its latency is kept to measure what the unhedged p99 would have been.
+    A primary that is cancelled or still running counts with its elapsed time so far,
+    a lower bound that keeps slow primaries from vanishing out of the unhedged p99.
+    """
+
+    def __init__(self, inner: ExchangeClient, policy: HedgePolicy | None = None) -> None:
+        self.inner = inner
+        self.venue = inner.venue
+        self.policy = policy or HedgePolicy()
+        self._primary_latencies: deque[float] = deque(maxlen=self.policy.window)
+        self._observed_latencies: deque[float] = deque(maxlen=self.policy.window)
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget = float(self.policy.budget_burst)
+        self._background: set[asyncio.Future[OrderBook]] = set()
+        self._inflight_primaries: dict[asyncio.Future[OrderBook], float] = {}
+
+    def hedge_delay(self) -> float:
+        if len(self._primary_latencies) < self.policy.min_samples:
+            return self.policy.initial_delay
+        delay = _percentile(self._primary_latencies, self.policy.percentile)
+        assert delay is not None
+        return max(delay, self.policy.min_delay)
+
+    def stats(self) -> HedgeStats:
+        now = time.monotonic()
+        unhedged = [*self._primary_latencies]
+        unhedged += (now - started for started in self._inflight_primaries.values())
+        return HedgeStats(
+            requests=self._requests,
+            hedges=self._hedges,
+            hedge_wins=self._hedge_wins,
+            p99_latency=_percentile(self._observed_latencies, 0.99),
+            p99_unhedged_latency=_percentile(unhedged, 0.99),
+        )
+
+    def _earn_budget(self) -> None:
+        cap = max(float(self.policy.budget_burst), 1.0)
+        self._budget = min(self._budget + self.policy.budget_ratio, cap)
+
+    def _spend_budget(self) -> bool:
+        if self._budget < 1.0:
+            return False
+        self._budget -= 1.0
+        return True
+
+    def _track(self, future: asyncio.Future[OrderBook], started: float, primary: bool) -> None:
+        def _done(fut: asyncio.Future[OrderBook]) -> None:
+            self._background.discard(fut)
+            if not primary:
+                if not fut.cancelled():
+                    # Retrieve failures so abandoned requests do not log "never retrieved".
+                    fut.exception()
+                return
+            self._inflight_primaries.pop(fut, None)
+            # A cancelled primary never reports, so keep its elapsed time as a lower bound.
+            if fut.cancelled() or fut.exception() is None:
+                self._primary_latencies.append(time.monotonic() - started)
+
+        self._background.add(future)
+        if primary:
+            self._inflight_primaries[future] = started
+        future.add_done_callback(_done)
+
+    async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
+        started = time.monotonic()
+        delay = self.hedge_delay()
+        self._requests += 1
+        self._earn_budget()
+
+        primary = asyncio.ensure_future(self.inner.fetch_order_book(symbol, depth))
+        self._track(primary, started, primary=True)
+        pending: set[asyncio.Future[OrderBook]] = {primary}
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and self._spend_budget():
+                self._hedges += 1
+                hedge = asyncio.ensure_future(self.inner.fetch_order_book(symbol, depth))
+                self._track(hedge, started, primary=False)
+                pending.add(hedge)
+
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    exc = future.exception()
+                    if exc is not None:
+                        error = exc
+                        continue
+                    if future is not primary:
+                        self._hedge_wins += 1
+                    self._observed_latencies.append(time.monotonic() - started)
+                    return future.result()
+            assert error is not None
+            raise error
+        except asyncio.CancelledError:
+            for future in pending:
+                future.cancel()
+            raise
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        return await self.inner.fetch_server_time()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
@@ -9,7 +10,7 @@ import httpx
 
 from arblens.domain.models import OrderBook, OrderBookLevel
 from arblens.domain.models.exchange import Exchange
-from arblens.exchanges.base import ExchangeClient
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
 from arblens.exchanges.errors import (
     ExchangeError,
     ExchangeHttpError,
@@ -17,6 +18,7 @@ from arblens.exchanges.errors import (
     ExchangeRateLimitError,
 )
 from arblens.exchanges.symbols import canonical_symbol, exchange_symbol
+from arblens.pipeline.profiling import profile_stage
 
 _OKX_TIMEOUT = httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=10.0)
 _OKX_BASE_URL = "https://www.okx.com"
@@ -66,8 +68,12 @@ def parse_okx_order_book(payload: dict[str, Any], symbol: str) -> OrderBook:
     if not raw_asks:
         raise ExchangeParseError("OKX payload has empty asks list")
 
-    bids = sorted(_parse_levels(raw_bids), key=lambda level: level.price, reverse=True)
-    asks = sorted(_parse_levels(raw_asks), key=lambda level: level.price)
+    with profile_stage("parse_levels"):
+        parsed_bids = _parse_levels(raw_bids)
+        parsed_asks = _parse_levels(raw_asks)
+    with profile_stage("sort"):
+        bids = sorted(parsed_bids, key=lambda level: level.price, reverse=True)
+        asks = sorted(parsed_asks, key=lambda level: level.price)
 
     timestamp_value = book.get("ts")
     if timestamp_value is None:
@@ -87,6 +93,23 @@ def parse_okx_order_book(payload: dict[str, Any], symbol: str) -> OrderBook:
     )
 
 
+def parse_okx_server_time(payload: dict[str, Any]) -> datetime:
+    code = payload.get("code")
+    if code not in (None, "0", 0):
+        message = payload.get("msg", "")
+        raise ExchangeError(f"OKX API error {code}: {message}")
+
+    data = payload.get("data")
+    if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+        raise ExchangeParseError("OKX payload missing data array")
+
+    try:
+        timestamp_ms = int(data[0]["ts"])
+    except (KeyError, ValueError, TypeError) as exc:
+        raise ExchangeParseError("OKX payload has invalid server time") from exc
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=UTC)
+
+
 class OkxClient(ExchangeClient):
     venue = Exchange.OKX
 
@@ -94,24 +117,44 @@ class OkxClient(ExchangeClient):
         exchange_sym = exchange_symbol(self.venue, symbol)
         params = {"instId": exchange_sym, "sz": str(depth)}
 
-        async with httpx.AsyncClient(base_url=_OKX_BASE_URL, timeout=_OKX_TIMEOUT) as client:
-            try:
-                response = await client.get("/api/v5/market/books", params=params)
-            except httpx.TimeoutException as exc:
-                raise ExchangeError("OKX request timed out") from exc
-            except httpx.HTTPError as exc:
-                raise ExchangeError("OKX request failed") from exc
+        async with self._http_client() as client:
+            payload = await self._get_json(client, "/api/v5/market/books", params)
+        return parse_okx_order_book(payload, symbol)
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        async with self._http_client() as client:
+            # The first request pays for DNS, TCP and TLS setup; only the second, over the
+            # warm pooled connection, is timed.
+            await self._get_json(client, "/api/v5/public/time", {})
+            sent = time.time()
+            payload = await self._get_json(client, "/api/v5/public/time", {})
+            received = time.time()
+        return ServerTimeProbe(parse_okx_server_time(payload), sent=sent, received=received)
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=_OKX_BASE_URL, timeout=_OKX_TIMEOUT)
+
+    async def _get_json(
+        self, client: httpx.AsyncClient, path: str, params: dict[str, str]
+    ) -> dict[str, Any]:
+        try:
+            response = await client.get(path, params=params)
+        except httpx.TimeoutException as exc:
+            raise ExchangeError("OKX request timed out") from exc
+        except httpx.HTTPError as exc:
+            raise ExchangeError("OKX request failed") from exc
 
         if response.status_code != 200:
             body_snippet = response.text[:200]
             raise ExchangeHttpError(response.status_code, body_snippet)
 
         try:
-            payload = response.json()
+            with profile_stage("json_decode"):
+                payload = response.json()
         except ValueError as exc:
             raise ExchangeParseError("OKX response is not valid JSON") from exc
 
         if not isinstance(payload, dict):
             raise ExchangeParseError("OKX JSON response is not an object")
 
-        return parse_okx_order_book(payload, symbol)
+        return payload
@@ -5,11 +5,15 @@ _INPUT_TO_CANONICAL = {
     "ETH/USDT": "ETH/USDT",
     "ETH-USDT": "ETH/USDT",
     "ETHUSDT": "ETH/USDT",
+    "ETH/BTC": "ETH/BTC",
+    "ETH-BTC": "ETH/BTC",
+    "ETHBTC": "ETH/BTC",
 }
 
 _CANONICAL_TO_EXCHANGE = {
     "BTC/USDT": {"bybit": "BTCUSDT", "okx": "BTC-USDT"},
     "ETH/USDT": {"bybit": "ETHUSDT", "okx": "ETH-USDT"},
+    "ETH/BTC": {"bybit": "ETHBTC", "okx": "ETH-BTC"},
 }
 
 
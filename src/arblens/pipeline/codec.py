@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from arblens.domain.models import OrderBook, OrderBookLevel
+
+# Book message: kind, venue length, symbol length, venue, symbol, timestamp (us since
+# epoch), age (us, as measured by the publisher; _NO_AGE when unknown), bid count,
+# ask count, then (price, size) float64 pairs, bids before asks.
+# Subscribe message: kind, filter count, then (venue length, symbol length, venue,
+# symbol) per filter. All integers are little-endian.
+BOOK_MESSAGE = 1
+SUBSCRIBE_MESSAGE = 2
+
+_BOOK_HEAD = struct.Struct("<BBB")
+_BOOK_META = struct.Struct("<qqHH")
+_SUBSCRIBE_HEAD = struct.Struct("<BH")
+_FILTER_HEAD = struct.Struct("<BB")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_AGE = -(2**63)
+
+BookKey = tuple[str, str]
+
+
+def _encode_text(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) > 255:
+        raise ValueError(f"Text too long to encode: {value!r}")
+    return raw
+
+
+def encode_order_book(book: OrderBook) -> bytes:
+    venue = _encode_text(book.venue)
+    symbol = _encode_text(book.symbol)
+    if len(book.bids) > 0xFFFF or len(book.asks) > 0xFFFF:
+        raise ValueError("Order book has too many levels to encode")
+
+    delta = book.timestamp - _EPOCH
+    timestamp_us = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    age_us = _NO_AGE if book.age is None else book.age // _MICROSECOND
+
+    values: list[float] = []
+    for level in book.bids:
+        values += (level.price, level.size)
+    for level in book.asks:
+        values += (level.price, level.size)
+
+    return b"".join(
+        (
+            _BOOK_HEAD.pack(BOOK_MESSAGE, len(venue), len(symbol)),
+            venue,
+            symbol,
+            _BOOK_META.pack(timestamp_us, age_us, len(book.bids), len(book.asks)),
+            struct.pack(f"<{len(values)}d", *values),
+        )
+    )
+
+
+def decode_order_book(data: bytes) -> OrderBook:
+    try:
+        kind, venue_len, symbol_len = _BOOK_HEAD.unpack_from(data, 0)
+        if kind != BOOK_MESSAGE:
+            raise ValueError(f"Not a book message: kind={kind}")
+        offset = _BOOK_HEAD.size
+        venue = data[offset : offset + venue_len].decode("utf-8")
+        offset += venue_len
+        symbol = data[offset : offset + symbol_len].decode("utf-8")
+        offset += symbol_len
+        timestamp_us, age_us, bid_count, ask_count = _BOOK_META.unpack_from(data, offset)
+        offset += _BOOK_META.size
+        values = struct.unpack_from(f"<{2 * (bid_count + ask_count)}d", data, offset)
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed book message") from exc
+
+    levels = [OrderBookLevel(price=values[i], size=values[i + 1]) for i in range(0, len(values), 2)]
+    return OrderBook(
+        bids=levels[:bid_count],
+        asks=levels[bid_count:],
+        timestamp=datetime.fromtimestamp(timestamp_us / 1_000_000, tz=UTC),
+        venue=venue,
+        symbol=symbol,
+        age=None if age_us == _NO_AGE else timedelta(microseconds=age_us),
+    )
+
+
+def encode_subscribe(filters: Iterable[BookKey]) -> bytes:
+    parts: list[bytes] = []
+    for venue, symbol in filters:
+        venue_raw = _encode_text(venue)
+        symbol_raw = _encode_text(symbol)
+        parts += (_FILTER_HEAD.pack(len(venue_raw), len(symbol_raw)), venue_raw, symbol_raw)
+    return _SUBSCRIBE_HEAD.pack(SUBSCRIBE_MESSAGE, len(parts) // 3) + b"".join(parts)
+
+
+def decode_subscribe(data: bytes) -> frozenset[BookKey]:
+    try:
+        kind, count = _SUBSCRIBE_HEAD.unpack_from(data, 0)
+        if kind != SUBSCRIBE_MESSAGE:
+            raise ValueError(f"Not a subscribe message: kind={kind}")
+        offset = _SUBSCRIBE_HEAD.size
+        filters: set[BookKey] = set()
+        for _ in range(count):
+            venue_len, symbol_len = _FILTER_HEAD.unpack_from(data, offset)
+            offset += _FILTER_HEAD.size
+            venue = data[offset : offset + venue_len].decode("utf-8")
+            offset += venue_len
+            symbol = data[offset : offset + symbol_len].decode("utf-8")
+            offset += symbol_len
+            filters.add((venue, symbol))
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed subscribe message") from exc
+    return frozenset(filters)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import struct
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from arblens.domain.models import OrderBook
+from arblens.pipeline.codec import (
+    BookKey,
+    decode_order_book,
+    decode_subscribe,
+    encode_order_book,
+    encode_subscribe,
+)
+
+_FRAME_HEAD = struct.Struct("<I")
+_SUBSCRIBE_TIMEOUT = 5.0
+# A full book (65535 levels per side) encodes to about 2 MiB; filters stay far smaller.
+_MAX_BOOK_FRAME = 4 * 1024 * 1024
+_MAX_SUBSCRIBE_FRAME = 64 * 1024
+
+
+def _frame(body: bytes) -> bytes:
+    return _FRAME_HEAD.pack(len(body)) + body
+
+
+async def _read_frame(reader: asyncio.StreamReader, max_size: int) -> bytes | None:
+    try:
+        head = await reader.readexactly(_FRAME_HEAD.size)
+        (length,) = _FRAME_HEAD.unpack(head)
+        if length > max_size:
+            raise ValueError(f"Frame of {length} bytes exceeds limit of {max_size}")
+        return await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    filters: frozenset[BookKey]
+    writer: asyncio.StreamWriter
+    pending: dict[BookKey, bytes] = field(default_factory=dict)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    stalled_since: float | None = None
+    conflated: int = 0
+
+    def wants(self, key: BookKey) -> bool:
+        return not self.filters or key in self.filters
+
+
+@dataclass(frozen=True, slots=True)
+class PublisherStats:
+    subscribers: int
+    published: int
+    conflated: int
+    dropped: int
+
+
+class BookPublisher:
+    """Fan normalized order books out to local subscribers over a Unix domain socket.
+
+    `publish` never waits on a subscriber. Each subscriber keeps only the latest
+    unsent book per (venue, symbol), so a slow reader receives conflated updates,
+    and a reader that has not drained for `stall_timeout` seconds is disconnected.
+    """
+
+    def __init__(self, path: str | Path, stall_timeout: float = 5.0) -> None:
+        self.path = Path(path)
+        self.stall_timeout = stall_timeout
+        self._server: asyncio.Server | None = None
+        self._subscribers: set[_Subscriber] = set()
+        self._published = 0
+        self._conflated = 0
+        self._dropped = 0
+
+    async def __aenter__(self) -> BookPublisher:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.path))
+
+    async def close(self) -> None:
+        for subscriber in list(self._subscribers):
+            self._drop(subscriber)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.path.unlink(missing_ok=True)
+
+    def stats(self) -> PublisherStats:
+        return PublisherStats(
+            subscribers=len(self._subscribers),
+            published=self._published,
+            conflated=self._conflated + sum(sub.conflated for sub in self._subscribers),
+            dropped=self._dropped,
+        )
+
+    def publish(self, book: OrderBook) -> None:
+        key = (book.venue, book.symbol)
+        frame: bytes | None = None
+        now = asyncio.get_running_loop().time()
+        for subscriber in list(self._subscribers):
+            if not subscriber.wants(key):
+                continue
+            stalled = subscriber.stalled_since
+            if stalled is not None and now - stalled > self.stall_timeout:
+                self._dropped += 1
+                self._drop(subscriber)
+                continue
+            if frame is None:
+                frame = _frame(encode_order_book(book))
+            if key in subscriber.pending:
+                subscriber.conflated += 1
+            subscriber.pending[key] = frame
+            subscriber.wakeup.set()
+        self._published += 1
+
+    def _drop(self, subscriber: _Subscriber) -> None:
+        if subscriber in self._subscribers:
+            self._subscribers.discard(subscriber)
+            self._conflated += subscriber.conflated
+        subscriber.pending.clear()
+        # Abort rather than close: a stalled reader would never let the buffer flush.
+        subscriber.writer.transport.abort()
+        # Wake the writer loop so it notices the closed transport and exits.
+        subscriber.wakeup.set()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            body = await asyncio.wait_for(
+                _read_frame(reader, _MAX_SUBSCRIBE_FRAME), _SUBSCRIBE_TIMEOUT
+            )
+            filters = decode_subscribe(body) if body is not None else None
+        except (TimeoutError, ValueError):
+            filters = None
+        if filters is None:
+            writer.close()
+            return
+
+        subscriber = _Subscriber(filters=filters, writer=writer)
+        self._subscribers.add(subscriber)
+        loop = asyncio.get_running_loop()
+        try:
+            while not writer.is_closing():
+                await subscriber.wakeup.wait()
+                subscriber.wakeup.clear()
+                if not subscriber.pending or writer.is_closing():
+                    continue
+                frames = list(subscriber.pending.values())
+                subscriber.pending.clear()
+                writer.writelines(frames)
+                subscriber.stalled_since = loop.time()
+                await writer.drain()
+                subscriber.stalled_since = None
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._drop(subscriber)
+
+
+async def subscribe(path: str | Path, filters: Iterable[BookKey] = ()) -> AsyncIterator[OrderBook]:
+    """Yield books from a `BookPublisher`, limited to `filters` (all books when empty)."""
+    reader, writer = await asyncio.open_unix_connection(str(path))
+    try:
+        writer.write(_frame(encode_subscribe(filters)))
+        await writer.drain()
+        while True:
+            body = await _read_frame(reader, _MAX_BOOK_FRAME)
+            if body is None:
+                return
+            yield decode_order_book(body)
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
@@ -0,0 +1,8 @@
+from datetime import timedelta
+
+from arblens.domain.models import OrderBook
+
+
+def is_stale(book: OrderBook, max_age: timedelta) -> bool:
+    """True when the book's corrected age exceeds `max_age`; unknown ages are kept."""
+    return book.age is not None and book.age > max_age
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import pstats
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Stage enter/exit frames land in every stage profile; they are overhead, not pipeline work.
+_BOOKKEEPING_FILES = frozenset({__file__, contextlib.__file__})
+
+_active: ContextVar[StageProfiler | None] = ContextVar("arblens_stage_profiler", default=None)
+
+
+@dataclass
+class _StageRecord:
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile)
+    calls: int = 0
+    seconds: float = 0.0
+    allocated: int = 0
+
+
+class StageProfiler:
+    """Collect cProfile and tracemalloc statistics per pipeline stage.
+
+    Each stage has its own profiler and only the innermost stage is enabled, so
+    call statistics are exclusive to a stage. Stage boundaries only read the traced
+    memory counter, giving net bytes per stage with nested stages included; the
+    allocation sites come from two snapshots taken around the whole profiled run,
+    because a snapshot costs time proportional to the number of live allocations.
+    Time spent in nested stage bookkeeping is subtracted from the enclosing stage.
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        self.top = top
+        self._stages: dict[str, _StageRecord] = {}
+        self._stack: list[_StageRecord] = []
+        self._overhead = 0.0
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._sites: Counter[str] = Counter()
+
+    def start(self) -> None:
+        if tracemalloc.is_tracing():
+            self._baseline = tracemalloc.take_snapshot()
+
+    def finish(self) -> None:
+        if self._baseline is None or not tracemalloc.is_tracing():
+            return
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+        for diff in after.compare_to(self._baseline.filter_traces(filters), "lineno"):
+            if diff.size_diff:
+                frame = diff.traceback[0]
+                self._sites[f"{frame.filename}:{frame.lineno}"] += diff.size_diff
+        self._baseline = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        entered = time.perf_counter()
+        record = self._stages.setdefault(name, _StageRecord())
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            parent.profile.disable()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        self._stack.append(record)
+        overhead_before = self._overhead
+        started = time.perf_counter()
+        # Entry bookkeeping counts against the enclosing stages only.
+        self._overhead += started - entered
+        record.profile.enable()
+        try:
+            yield
+        finally:
+            record.profile.disable()
+            exiting = time.perf_counter()
+            record.seconds += exiting - started - (self._overhead - overhead_before)
+            record.calls += 1
+            record.allocated += tracemalloc.get_traced_memory()[0] - memory_before
+            self._stack.pop()
+            if parent is not None:
+                parent.profile.enable()
+            self._overhead += time.perf_counter() - exiting
+
+    def stats(self) -> pstats.Stats | None:
+        """Call statistics of all stages merged, or None if nothing was profiled."""
+        profiles = [record.profile for record in self._stages.values() if record.calls]
+        if not profiles:
+            return None
+        merged = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            merged.add(profile)
+        return merged
+
+    def _ranked(self, record: _StageRecord) -> list[tuple[tuple[str, int, str], int, float]]:
+        """Top functions of a stage by exact own time, without profiler bookkeeping frames."""
+        entries = pstats.Stats(record.profile).stats  # type: ignore[attr-defined]
+        ranked = [
+            (func, calls, tottime)
+            for func, (_, calls, tottime, _, _) in entries.items()
+            if func[0] not in _BOOKKEEPING_FILES
+        ]
+        ranked.sort(key=lambda entry: entry[2], reverse=True)
+        return ranked[: self.top]
+
+    def summary(self) -> str:
+        lines: list[str] = []
+        for name, record in self._stages.items():
+            if not record.calls:
+                continue
+            lines.append(f"[{name}] calls={record.calls} wall={record.seconds:.6f}s")
+            for (file_name, line_number, func_name), calls, tottime in self._ranked(record):
+                lines.append(
+                    f"  {tottime:.6f}s {calls:>6} calls {func_name} ({file_name}:{line_number})"
+                )
+            lines.append(f"  net allocated {record.allocated / 1024:.1f} KiB")
+        if self._sites:
+            lines.append("[allocation sites]")
+            for site, size in self._sites.most_common(self.top):
+                lines.append(f"  {size / 1024:10.1f} KiB {site}")
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> Path:
+        """Write a pstats file to `path` and the text summary next to it; return the latter."""
+        merged = self.stats()
+        if merged is not None:
+            merged.dump_stats(path)
+        summary_path = path.with_suffix(".txt")
+        summary_path.write_text(self.summary() + "\n", encoding="utf-8")
+        return summary_path
+
+
+@contextmanager
+def profiling(profiler: StageProfiler) -> Iterator[StageProfiler]:
+    """Activate `profiler` for `profile_stage` blocks and trace allocations meanwhile."""
+    token = _active.set(profiler)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.finish()
+        if started_tracing:
+            tracemalloc.stop()
+        _active.reset(token)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """Mark a pipeline stage; a no-op unless a `profiling` block is active."""
+    profiler = _active.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
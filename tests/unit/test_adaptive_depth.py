@@ -0,0 +1,94 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from arblens.domain.models import OrderBook, OrderBookLevel
+from arblens.domain.models.exchange import Exchange
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
+from arblens.exchanges.depth import AdaptiveDepthClient, DepthPolicy, depth_tier
+
+
+class _UniformBookClient(ExchangeClient):
+    """Serves up to `available` levels of `level_notional` each on both sides."""
+
+    venue = Exchange.OKX
+
+    def __init__(self, level_notional: float, available: int = 400) -> None:
+        self.level_notional = level_notional
+        self.available = available
+        self.requested: list[int] = []
+
+    async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
+        self.requested.append(depth)
+        count = min(depth, self.available)
+        size = self.level_notional / 100.0
+        return OrderBook(
+            bids=[OrderBookLevel(price=100.0 - i * 0.01, size=size) for i in range(count)],
+            asks=[OrderBookLevel(price=100.0 + i * 0.01, size=size) for i in range(count)],
+            timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+            venue="okx",
+            symbol="BTC/USDT",
+        )
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        return ServerTimeProbe(datetime(2026, 1, 1, tzinfo=UTC), sent=0.0, received=0.0)
+
+
+def test_depth_tier_rounds_up_and_caps() -> None:
+    assert depth_tier(1, 200) == 1
+    assert depth_tier(7, 200) == 10
+    assert depth_tier(21, 200) == 50
+    assert depth_tier(21, 30) == 30
+    assert depth_tier(1000, 200) == 200
+
+
+async def test_shrinks_depth_once_book_shape_is_known() -> None:
+    inner = _UniformBookClient(level_notional=1000.0)
+    client = AdaptiveDepthClient(inner, DepthPolicy(target_notional=3000.0))
+
+    await client.fetch_order_book("BTC/USDT", 20)
+    await client.fetch_order_book("BTC-USDT", 20)
+
+    # 3000 * 1.5 headroom / ~1000 per level -> 5 levels.
+    assert inner.requested == [20, 5]
+    assert client.stats().refetches == 0
+
+
+async def test_refetches_deeper_when_liquidity_falls_short() -> None:
+    inner = _UniformBookClient(level_notional=1000.0)
+    client = AdaptiveDepthClient(inner, DepthPolicy(target_notional=40_000.0))
+
+    book = await client.fetch_order_book("BTC/USDT", 5)
+
+    assert inner.requested == [5, 100]
+    assert len(book.asks) == 100
+    assert client.stats().refetches == 1
+
+
+async def test_does_not_refetch_when_venue_has_no_more_levels() -> None:
+    inner = _UniformBookClient(level_notional=1000.0, available=3)
+    client = AdaptiveDepthClient(inner, DepthPolicy(target_notional=40_000.0))
+
+    await client.fetch_order_book("BTC/USDT", 5)
+
+    assert inner.requested == [5]
+
+
+async def test_refetch_stops_at_deepest_tier() -> None:
+    inner = _UniformBookClient(level_notional=1000.0)
+    client = AdaptiveDepthClient(inner, DepthPolicy(target_notional=1e9))
+
+    book = await client.fetch_order_book("BTC/USDT", 5)
+
+    assert inner.requested == [5, 200]
+    assert len(book.bids) == 200
+
+
+def test_policy_rejects_non_positive_notional() -> None:
+    with pytest.raises(ValueError):
+        DepthPolicy(target_notional=0.0)
+
+
+def test_policy_rejects_depth_beyond_venue_tiers() -> None:
+    with pytest.raises(ValueError):
+        DepthPolicy(target_notional=1e9, max_depth=400)
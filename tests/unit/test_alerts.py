@@ -0,0 +1,162 @@
+import math
+import random
+from datetime import UTC, datetime
+
+import pytest
+
+from arblens.analytics import (
+    AlertEngine,
+    AlertRule,
+    AlertTransition,
+    PairSpread,
+    depth_notional_columns,
+    pair_spread_columns,
+)
+from arblens.domain.models import OrderBook, OrderBookLevel
+
+
+def test_fires_after_consecutive_ticks_only_once() -> None:
+    rule = AlertRule("wide_sell", "spread_sell_pct", ">", 0.001, consecutive=3)
+    engine = AlertEngine([rule], keys=["BTC/USDT", "ETH/USDT"])
+
+    ticks = [[0.002, 0.002], [0.002, 0.0], [0.002, 0.002], [0.002, 0.002]]
+    emitted = [engine.evaluate({"spread_sell_pct": tick}) for tick in ticks]
+
+    assert emitted == [
+        [],
+        [],
+        [AlertTransition("wide_sell", "BTC/USDT", True, 0.002)],
+        [],
+    ]
+    assert engine.active("wide_sell") == ["BTC/USDT"]
+
+
+def test_hysteresis_keeps_alert_active_until_clear_threshold() -> None:
+    rule = AlertRule("wide", "spread_sell", ">", 10.0, clear_threshold=5.0)
+    engine = AlertEngine([rule], keys=["BTC/USDT"])
+
+    assert engine.evaluate({"spread_sell": [12.0]})[0].active is True
+    assert engine.evaluate({"spread_sell": [8.0]}) == []
+    assert engine.evaluate({"spread_sell": [4.0]}) == [
+        AlertTransition("wide", "BTC/USDT", False, 4.0)
+    ]
+
+
+def test_missing_values_neither_fire_nor_clear() -> None:
+    rule = AlertRule("wide", "spread_buy", ">", 10.0)
+    engine = AlertEngine([rule], keys=["BTC/USDT"])
+    engine.evaluate({"spread_buy": [12.0]})
+
+    columns = pair_spread_columns([PairSpread(spread_sell=None, spread_buy=None)])
+
+    assert math.isnan(columns["spread_buy"][0])
+    assert engine.evaluate(columns) == []
+    assert engine.active("wide") == ["BTC/USDT"]
+
+
+def test_pair_spread_columns_adds_relative_spreads() -> None:
+    columns = pair_spread_columns(
+        [PairSpread(spread_sell=65.0, spread_buy=-10.0)], reference_prices=[65000.0]
+    )
+
+    assert columns["spread_sell_pct"] == [0.001]
+    assert columns["spread_buy_pct"] == pytest.approx([-10.0 / 65000.0])
+
+
+def test_rejects_misaligned_columns_and_bad_rules() -> None:
+    engine = AlertEngine([AlertRule("r", "spread_sell", ">", 0.0)], keys=["a", "b"])
+
+    with pytest.raises(ValueError):
+        engine.evaluate({"spread_sell": [1.0]})
+    with pytest.raises(ValueError):
+        engine.evaluate({"spread_buy": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        AlertRule("r", "spread_sell", ">", 1.0, clear_threshold=2.0)
+
+
+def test_streak_resets_on_miss_and_realerts_after_clear() -> None:
+    rule = AlertRule("wide", "spread_sell", ">", 1.0, consecutive=2)
+    engine = AlertEngine([rule], keys=["a", "b"])
+
+    ticks = [[2.0, 2.0], [0.0, 2.0], [2.0, 0.0], [2.0, 2.0], [2.0, 2.0]]
+    emitted = [engine.evaluate({"spread_sell": tick}) for tick in ticks]
+
+    assert emitted == [
+        [],
+        [AlertTransition("wide", "b", True, 2.0)],
+        [AlertTransition("wide", "b", False, 0.0)],
+        [AlertTransition("wide", "a", True, 2.0)],
+        [AlertTransition("wide", "b", True, 2.0)],
+    ]
+
+
+def test_depth_notional_columns_sum_levels_within_band() -> None:
+    book = OrderBook(
+        bids=[OrderBookLevel(100.0, 1.0), OrderBookLevel(99.95, 2.0), OrderBookLevel(99.0, 5.0)],
+        asks=[OrderBookLevel(100.1, 1.0), OrderBookLevel(101.0, 3.0)],
+        timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+        venue="okx",
+        symbol="BTC/USDT",
+    )
+
+    columns = depth_notional_columns([book, None], within_bps=10.0)
+
+    assert columns["bid_notional"][0] == pytest.approx(100.0 + 199.9)
+    assert columns["ask_notional"][0] == pytest.approx(100.1)
+    assert math.isnan(columns["bid_notional"][1])
+
+
+def _naive_evaluate(
+    rule: AlertRule,
+    keys: list[str],
+    column: list[float],
+    streaks: list[int],
+    active: list[bool],
+) -> list[AlertTransition]:
+    transitions = []
+    clear_threshold = rule.threshold if rule.clear_threshold is None else rule.clear_threshold
+    for i, value in enumerate(column):
+        if value > rule.threshold:
+            streaks[i] += 1
+            if not active[i] and streaks[i] >= rule.consecutive:
+                active[i] = True
+                transitions.append(AlertTransition(rule.name, keys[i], True, value))
+        else:
+            streaks[i] = 0
+            if active[i] and value <= clear_threshold:
+                active[i] = False
+                transitions.append(AlertTransition(rule.name, keys[i], False, value))
+    return transitions
+
+
+def test_activations_precede_clears_within_a_tick() -> None:
+    rule = AlertRule("wide", "spread_sell", ">", 1.0)
+    engine = AlertEngine([rule], keys=["a", "b"])
+    engine.evaluate({"spread_sell": [2.0, 0.0]})
+
+    assert engine.evaluate({"spread_sell": [0.0, 2.0]}) == [
+        AlertTransition("wide", "b", True, 2.0),
+        AlertTransition("wide", "a", False, 0.0),
+    ]
+
+
+def _by_key(transitions: list[AlertTransition]) -> list[AlertTransition]:
+    return sorted(transitions, key=lambda transition: (transition.key, transition.active))
+
+
+def test_engine_matches_naive_per_key_loop() -> None:
+    size, ticks = 2_000, 100
+    rng = random.Random(7)
+    keys = [f"SYM{i:04d}" for i in range(size)]
+    # Frequent hits so that many ticks both activate and clear keys.
+    columns = [[0.002 if rng.random() < 0.3 else 0.0005 for _ in range(size)] for _ in range(ticks)]
+    rule = AlertRule("wide", "spread_sell_pct", ">", 0.001, consecutive=2)
+
+    engine = AlertEngine([rule], keys)
+    engine_out = [engine.evaluate({"spread_sell_pct": column}) for column in columns]
+    streaks, active = [0] * size, [False] * size
+    naive_out = [_naive_evaluate(rule, keys, column, streaks, active) for column in columns]
+
+    mixed = [tick for tick in naive_out if len({t.active for t in tick}) == 2]
+    assert mixed
+    assert [_by_key(tick) for tick in engine_out] == [_by_key(tick) for tick in naive_out]
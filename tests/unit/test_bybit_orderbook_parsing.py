@@ -31,3 +31,15 @@ def test_bybit_orderbook_parsing() -> None:
     assert order_book.timestamp.tzinfo is not None
     assert order_book.timestamp.utcoffset() == timedelta(0)
     assert order_book.timestamp.tzinfo is UTC
+
+
+def test_bybit_missing_book_ts_falls_back_to_response_time() -> None:
+    payload = {
+        "retCode": 0,
+        "result": {"s": "BTCUSDT", "b": [["65000", "0.5"]], "a": [["65100", "0.4"]]},
+        "time": 1700000000123,
+    }
+
+    order_book = parse_bybit_order_book(payload, "BTC/USDT")
+
+    assert order_book.timestamp.timestamp() == 1700000000.123
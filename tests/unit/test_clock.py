@@ -0,0 +1,116 @@
+import time
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from arblens.domain.models import OrderBook
+from arblens.domain.models.exchange import Exchange
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
+from arblens.exchanges.bybit import BybitClient, parse_bybit_server_time
+from arblens.exchanges.clock import ClockCorrectedClient, ClockSkewEstimator
+from arblens.exchanges.errors import ExchangeError, ExchangeParseError
+from arblens.exchanges.okx import parse_okx_server_time
+from arblens.pipeline.freshness import is_stale
+
+
+def _book(timestamp: datetime) -> OrderBook:
+    return OrderBook(bids=[], asks=[], timestamp=timestamp, venue="okx", symbol="BTC/USDT")
+
+
+class _SkewedClient(ExchangeClient):
+    """Venue whose clock runs `skew` ahead and whose books are `lag` old when served."""
+
+    venue = Exchange.OKX
+
+    def __init__(self, skew: timedelta, lag: timedelta, fail_time: bool = False) -> None:
+        self.skew = skew
+        self.lag = lag
+        self.fail_time = fail_time
+
+    async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
+        return _book(datetime.now(UTC) + self.skew - self.lag)
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        if self.fail_time:
+            raise ExchangeError("boom")
+        now = time.time()
+        return ServerTimeProbe(datetime.now(UTC) + self.skew, sent=now, received=now)
+
+
+def test_estimator_prefers_shortest_round_trip() -> None:
+    estimator = ClockSkewEstimator()
+    assert estimator.offset is None
+
+    estimator.observe(sent=100.0, received=100.4, server_time=100.5)
+    estimator.observe(sent=200.0, received=200.02, server_time=200.26)
+
+    assert estimator.offset == pytest.approx(0.25)
+    assert estimator.latency == pytest.approx(0.01)
+
+
+def test_age_is_corrected_for_venue_clock() -> None:
+    estimator = ClockSkewEstimator()
+    estimator.observe(sent=1000.0, received=1000.0, server_time=1002.0)
+    book = _book(datetime.fromtimestamp(1001.5, tz=UTC))
+
+    # Received at local 1000.0 == venue 1002.0, so the book is 0.5s old, not -1.5s.
+    assert estimator.age(book, received=1000.0) == timedelta(seconds=0.5)
+
+
+async def test_client_annotates_books_with_corrected_age() -> None:
+    inner = _SkewedClient(skew=timedelta(seconds=3), lag=timedelta(seconds=2))
+    client = ClockCorrectedClient(inner)
+
+    book = await client.fetch_order_book("BTC/USDT", 5)
+
+    assert book.age is not None
+    assert abs(book.age - timedelta(seconds=2)) < timedelta(milliseconds=100)
+    assert is_stale(book, timedelta(seconds=1))
+    assert not is_stale(book, timedelta(seconds=5))
+
+
+async def test_failed_probe_leaves_age_unknown() -> None:
+    client = ClockCorrectedClient(
+        _SkewedClient(skew=timedelta(0), lag=timedelta(0), fail_time=True)
+    )
+
+    book = await client.fetch_order_book("BTC/USDT", 5)
+
+    assert book.age is None
+    assert not is_stale(book, timedelta(0))
+
+
+def test_parse_server_time_payloads() -> None:
+    bybit = {
+        "retCode": 0,
+        "result": {"timeSecond": "1700000000", "timeNano": "1700000000123456789"},
+        "time": 1700000000123,
+    }
+    okx = {"code": "0", "msg": "", "data": [{"ts": "1700000000456"}]}
+
+    assert parse_bybit_server_time(bybit) == datetime(2023, 11, 14, 22, 13, 20, 123457, UTC)
+    assert parse_okx_server_time(okx) == datetime(2023, 11, 14, 22, 13, 20, 456000, UTC)
+    with pytest.raises(ExchangeParseError):
+        parse_okx_server_time({"code": "0", "data": [{"ts": "nope"}]})
+
+
+async def test_server_time_probe_times_only_the_warm_request() -> None:
+    requests: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(time.time())
+        return httpx.Response(200, json={"retCode": 0, "result": {"timeSecond": "1700000000"}})
+
+    class _MockedBybit(BybitClient):
+        def _http_client(self) -> httpx.AsyncClient:
+            return httpx.AsyncClient(
+                base_url="https://bybit.test", transport=httpx.MockTransport(handler)
+            )
+
+    probe = await _MockedBybit().fetch_server_time()
+
+    assert len(requests) == 2
+    # The warm-up request falls outside the timed window; the second one inside it.
+    assert requests[0] <= probe.sent <= requests[1] <= probe.received
+    assert probe.server_time == datetime.fromtimestamp(1700000000, tz=UTC)
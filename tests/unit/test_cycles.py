@@ -0,0 +1,83 @@
+import math
+from datetime import UTC, datetime
+
+import pytest
+
+from arblens.analytics import RateGraph
+from arblens.domain.models import OrderBook, OrderBookLevel
+
+
+def _book(venue: str, symbol: str, bid: float | None, ask: float | None) -> OrderBook:
+    return OrderBook(
+        bids=[OrderBookLevel(price=bid, size=1.0)] if bid is not None else [],
+        asks=[OrderBookLevel(price=ask, size=1.0)] if ask is not None else [],
+        timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+        venue=venue,
+        symbol=symbol,
+    )
+
+
+def _consistent_graph() -> RateGraph:
+    graph = RateGraph()
+    for venue in ("bybit", "okx"):
+        graph.update(_book(venue, "BTC/USDT", 60000.0, 60010.0))
+        graph.update(_book(venue, "ETH/USDT", 3000.0, 3000.5))
+        graph.update(_book(venue, "ETH/BTC", 0.04999, 0.05001))
+    return graph
+
+
+def test_no_cycles_in_consistent_market() -> None:
+    graph = _consistent_graph()
+
+    assert len(graph) == 6
+    assert graph.find_cycles() == []
+
+
+def test_finds_triangular_cycle_across_venues() -> None:
+    graph = _consistent_graph()
+    # ETH is cheap in BTC on OKX: USDT -> BTC -> ETH (okx) -> USDT pays ~2%.
+    graph.update(_book("bybit", "ETH/BTC", 0.0488, 0.0491))
+    graph.update(_book("okx", "ETH/BTC", 0.0489, 0.0490))
+
+    cycles = graph.find_cycles()
+
+    assert len(cycles) == 1
+    legs = cycles[0].legs
+    assert {(leg.from_asset, leg.to_asset) for leg in legs} == {
+        ("USDT", "BTC"),
+        ("BTC", "ETH"),
+        ("ETH", "USDT"),
+    }
+    assert next(leg for leg in legs if leg.to_asset == "ETH").venue == "okx"
+    expected = (1 / 60010.0) * (1 / 0.0490) * 3000.0 - 1
+    assert math.isclose(cycles[0].gross_return, expected)
+
+
+def test_finds_two_leg_cross_venue_cycle() -> None:
+    graph = _consistent_graph()
+    graph.update(_book("bybit", "BTC/USDT", 60100.0, 60110.0))
+
+    cycles = graph.find_cycles()
+
+    assert len(cycles) == 1
+    assert {leg.venue for leg in cycles[0].legs} == {"bybit", "okx"}
+    assert cycles[0].gross_return == pytest.approx(60100.0 / 60010.0 - 1)
+
+
+def test_fees_remove_thin_opportunities() -> None:
+    graph = RateGraph(taker_fees={"bybit": 0.001, "okx": 0.001})
+    graph.update(_book("bybit", "BTC/USDT", 60030.0, 60040.0))
+    graph.update(_book("okx", "BTC/USDT", 60000.0, 60010.0))
+
+    assert graph.find_cycles() == []
+
+
+def test_best_edge_falls_back_when_venue_worsens() -> None:
+    graph = _consistent_graph()
+    graph.update(_book("bybit", "BTC/USDT", 60100.0, 60110.0))
+    assert graph.find_cycles()
+
+    graph.update(_book("bybit", "BTC/USDT", None, None))
+
+    assert graph.find_cycles() == []
+    assert len(graph) == 6
@@ -0,0 +1,127 @@
+import asyncio
+import struct
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from arblens.domain.models import OrderBook, OrderBookLevel
+from arblens.pipeline.codec import (
+    decode_order_book,
+    decode_subscribe,
+    encode_order_book,
+    encode_subscribe,
+)
+from arblens.pipeline.fanout import BookPublisher, subscribe
+
+
+def _book(venue: str, symbol: str, bid: float = 65000.0) -> OrderBook:
+    return OrderBook(
+        bids=[OrderBookLevel(price=bid, size=0.5), OrderBookLevel(price=bid - 1, size=1.25)],
+        asks=[OrderBookLevel(price=bid + 100, size=0.1)],
+        timestamp=datetime(2026, 1, 1, 12, 30, 1, 123456, tzinfo=UTC),
+        venue=venue,
+        symbol=symbol,
+    )
+
+
+def test_order_book_round_trip() -> None:
+    book = _book("bybit", "BTC/USDT")
+
+    decoded = decode_order_book(encode_order_book(book))
+
+    assert decoded.bids == book.bids
+    assert decoded.asks == book.asks
+    assert decoded.timestamp == book.timestamp
+    assert (decoded.venue, decoded.symbol) == ("bybit", "BTC/USDT")
+    assert decoded.age is None
+
+
+def test_order_book_age_round_trip() -> None:
+    book = replace(_book("okx", "BTC/USDT"), age=timedelta(milliseconds=-12, microseconds=7))
+
+    assert decode_order_book(encode_order_book(book)).age == book.age
+
+
+def test_subscribe_round_trip_and_malformed_input() -> None:
+    filters = [("okx", "ETH/USDT"), ("bybit", "BTC/USDT")]
+
+    assert decode_subscribe(encode_subscribe(filters)) == frozenset(filters)
+    with pytest.raises(ValueError):
+        decode_order_book(encode_order_book(_book("okx", "BTC/USDT"))[:-4])
+
+
+async def test_subscriber_receives_only_filtered_books(tmp_path: Path) -> None:
+    async with BookPublisher(tmp_path / "books.sock") as publisher:
+        stream = subscribe(publisher.path, [("okx", "ETH/USDT")])
+        first = asyncio.ensure_future(anext(stream))
+        while publisher.stats().subscribers == 0:
+            await asyncio.sleep(0.01)
+
+        publisher.publish(_book("bybit", "ETH/USDT"))
+        publisher.publish(_book("okx", "ETH/USDT"))
+
+        book = await asyncio.wait_for(first, 1.0)
+        await stream.aclose()
+
+    assert (book.venue, book.symbol) == ("okx", "ETH/USDT")
+
+
+async def test_pending_updates_are_conflated(tmp_path: Path) -> None:
+    async with BookPublisher(tmp_path / "books.sock") as publisher:
+        stream = subscribe(publisher.path)
+        first = asyncio.ensure_future(anext(stream))
+        while publisher.stats().subscribers == 0:
+            await asyncio.sleep(0.01)
+
+        # Published back to back: the writer has not run yet, so only the last survives.
+        for bid in (1.0, 2.0, 3.0):
+            publisher.publish(_book("okx", "BTC/USDT", bid=bid))
+
+        book = await asyncio.wait_for(first, 1.0)
+        await stream.aclose()
+        stats = publisher.stats()
+
+    assert book.bids[0].price == 3.0
+    assert stats.conflated == 2
+
+
+async def test_oversized_subscribe_frame_is_rejected(tmp_path: Path) -> None:
+    async with BookPublisher(tmp_path / "books.sock") as publisher:
+        reader, writer = await asyncio.open_unix_connection(str(publisher.path))
+        writer.write(struct.pack("<I", 0xFFFFFFFF))
+        await writer.drain()
+
+        assert await asyncio.wait_for(reader.read(), 1.0) == b""
+        assert publisher.stats().subscribers == 0
+        writer.close()
+
+
+async def test_stalled_subscriber_is_dropped(tmp_path: Path) -> None:
+    levels = [OrderBookLevel(price=1.0 + i, size=1.0) for i in range(20_000)]
+    big = replace(_book("okx", "BTC/USDT"), bids=levels, asks=levels)
+    async with BookPublisher(tmp_path / "books.sock", stall_timeout=0.05) as publisher:
+        reader, writer = await asyncio.open_unix_connection(str(publisher.path))
+        body = encode_subscribe([])
+        writer.write(struct.pack("<I", len(body)) + body)
+        await writer.drain()
+        while publisher.stats().subscribers == 0:
+            await asyncio.sleep(0.01)
+
+        # Never read: once the socket buffers fill, drain blocks and the stall clock runs.
+        for _ in range(200):
+            publisher.publish(big)
+            if publisher.stats().dropped:
+                break
+            await asyncio.sleep(0.01)
+        stats = publisher.stats()
+
+        received = 0
+        while chunk := await asyncio.wait_for(reader.read(1 << 20), 1.0):
+            received += len(chunk)
+        writer.close()
+
+    assert stats.dropped == 1
+    assert stats.subscribers == 0
+    assert received > 0
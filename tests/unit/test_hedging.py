@@ -0,0 +1,169 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
+from arblens.domain.models import OrderBook
+from arblens.domain.models.exchange import Exchange
+from arblens.exchanges.base import ExchangeClient, ServerTimeProbe
+from arblens.exchanges.errors import ExchangeError
+from arblens.exchanges.hedging import HedgePolicy, HedgingClient, _percentile
+
+
+class _GatedClient(ExchangeClient):
+    """Each call waits for its own gate; calls listed in `failing` raise once released."""
+
+    venue = Exchange.BYBIT
+
+    def __init__(self, calls: int, failing: Sequence[int] = ()) -> None:
+        self.gates = [asyncio.Event() for _ in range(calls)]
+        self.failing = set(failing)
+        self.calls = 0
+
+    def release(self, *calls: int) -> None:
+        for call in calls:
+            self.gates[call].set()
+
+    async def fetch_order_book(self, symbol: str, depth: int) -> OrderBook:
+        call = self.calls
+        self.calls += 1
+        await self.gates[call].wait()
+        if call in self.failing:
+            raise ExchangeError("boom")
+        return OrderBook(
+            bids=[],
+            asks=[],
+            timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+            venue="bybit",
+            symbol=symbol,
+        )
+
+    async def fetch_server_time(self) -> ServerTimeProbe:
+        return ServerTimeProbe(datetime(2026, 1, 1, tzinfo=UTC), sent=0.0, received=0.0)
+
+
+# A zero delay hedges any primary whose gate is closed; a long one never hedges.
+_HEDGE_NOW = HedgePolicy(initial_delay=0.0, min_delay=0.0)
+_NEVER_HEDGE = HedgePolicy(initial_delay=60.0)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    assert _percentile([], 0.99) is None
+    assert _percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert _percentile([float(i) for i in range(1, 101)], 0.99) == 99.0
+
+
+async def test_fast_primary_is_not_hedged() -> None:
+    inner = _GatedClient(1)
+    inner.release(0)
+    client = HedgingClient(inner, _NEVER_HEDGE)
+
+    await client.fetch_order_book("BTC/USDT", 5)
+
+    assert inner.calls == 1
+    assert client.stats().hedges == 0
+
+
+async def test_slow_primary_is_hedged_and_hedge_wins() -> None:
+    inner = _GatedClient(2)
+    inner.release(1)
+    client = HedgingClient(inner, _HEDGE_NOW)
+
+    await client.fetch_order_book("BTC/USDT", 5)
+    stats = client.stats()
+
+    assert inner.calls == 2
+    assert stats.hedges == 1
+    assert stats.hedge_wins == 1
+    assert stats.hedge_rate == 1.0
+    # The primary is still running; its elapsed time already counts as a lower bound.
+    assert stats.p99_latency is not None
+    assert stats.p99_unhedged_latency is not None
+    assert stats.p99_unhedged_latency >= stats.p99_latency
+
+    inner.release(0)
+    await asyncio.gather(*client._background)
+
+    assert len(client._primary_latencies) == 1
+
+
+async def test_cancelled_primary_counts_as_lower_bound() -> None:
+    inner = _GatedClient(2)
+    inner.release(1)
+    client = HedgingClient(inner, _HEDGE_NOW)
+
+    await client.fetch_order_book("BTC/USDT", 5)
+    abandoned = list(client._background)
+    for future in abandoned:
+        future.cancel()
+    await asyncio.gather(*abandoned, return_exceptions=True)
+    stats = client.stats()
+
+    assert len(client._primary_latencies) == 1
+    assert stats.p99_improvement is not None and stats.p99_improvement >= 0
+
+
+async def test_budget_limits_hedges() -> None:
+    inner = _GatedClient(3)
+    inner.release(1, 2)
+    client = HedgingClient(inner, HedgePolicy(initial_delay=0.0, budget_ratio=0.0, budget_burst=1))
+
+    await client.fetch_order_book("BTC/USDT", 5)
+    await client.fetch_order_book("BTC/USDT", 5)
+
+    assert inner.calls == 3
+    assert client.stats().hedges == 1
+
+
+async def test_quiet_period_does_not_bank_hedges() -> None:
+    inner = _GatedClient(1100)
+    inner.release(*range(1000))
+    client = HedgingClient(inner, _NEVER_HEDGE)
+    for _ in range(1000):
+        await client.fetch_order_book("BTC/USDT", 5)
+
+    # Same default budget, but every primary that is still gated now asks for a hedge.
+    client.policy = _HEDGE_NOW
+    slow = [asyncio.ensure_future(client.fetch_order_book("BTC/USDT", 5)) for _ in range(50)]
+    for _ in range(10):
+        await asyncio.sleep(0)
+    inner.release(*range(1000, 1100))
+    await asyncio.gather(*slow)
+
+    # A full burst plus what 50 requests earn, not the 100+ banked while idle.
+    assert 1 <= client.stats().hedges <= 2 + 0.1 * 50
+
+
+async def test_failure_is_raised_only_when_all_requests_fail() -> None:
+    failing = _GatedClient(1, failing=[0])
+    failing.release(0)
+    with pytest.raises(ExchangeError):
+        await HedgingClient(failing, _NEVER_HEDGE).fetch_order_book("BTC/USDT", 5)
+
+    inner = _GatedClient(2, failing=[1])
+    inner.release(1)
+    client = HedgingClient(inner, _HEDGE_NOW)
+    task = asyncio.ensure_future(client.fetch_order_book("BTC/USDT", 5))
+    while inner.calls < 2:
+        await asyncio.sleep(0)
+    inner.release(0)
+
+    book = await task
+
+    assert book.symbol == "BTC/USDT"
+    assert client.stats().hedge_wins == 0
+
+
+async def test_delay_adapts_to_recent_latency() -> None:
+    client = HedgingClient(_GatedClient(0), HedgePolicy(min_samples=3, min_delay=0.0))
+    assert client.hedge_delay() == client.policy.initial_delay
+
+    client._primary_latencies.extend([0.1, 0.2, 0.3])
+
+    assert client.hedge_delay() == 0.3
+
+
+def test_policy_rejects_invalid_percentile() -> None:
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=1.5)